@@ -12,14 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import os
 import re
-from hashlib import sha3_256
-from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, cached_property
+from hashlib import sha256
+from html import unescape
 from pathlib import Path
 from json import dumps, loads
+from threading import Lock
+from typing import TextIO
 
-from httpx import get
-from jinja2 import Environment, PackageLoader, select_autoescape
+from httpx import AsyncClient, Client, Limits, Response
+from jinja2 import Environment, PackageLoader, Template, nodes, select_autoescape
 from markupsafe import Markup
 from mistune import create_markdown
 from mistune.plugins import math
@@ -49,6 +55,75 @@ math.render_block_math = render_block_math_fixed
 math.render_inline_math = render_inline_math_fixed
 
 
+KATEX_FONTS_URL = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/fonts/"
+
+KATEX_FONTS = (
+    "KaTeX_AMS-Regular.ttf",
+    "KaTeX_AMS-Regular.woff",
+    "KaTeX_AMS-Regular.woff2",
+    "KaTeX_Caligraphic-Bold.ttf",
+    "KaTeX_Caligraphic-Bold.woff",
+    "KaTeX_Caligraphic-Bold.woff2",
+    "KaTeX_Caligraphic-Regular.ttf",
+    "KaTeX_Caligraphic-Regular.woff",
+    "KaTeX_Caligraphic-Regular.woff2",
+    "KaTeX_Fraktur-Bold.ttf",
+    "KaTeX_Fraktur-Bold.woff",
+    "KaTeX_Fraktur-Bold.woff2",
+    "KaTeX_Fraktur-Regular.ttf",
+    "KaTeX_Fraktur-Regular.woff",
+    "KaTeX_Fraktur-Regular.woff2",
+    "KaTeX_Main-Bold.ttf",
+    "KaTeX_Main-Bold.woff",
+    "KaTeX_Main-Bold.woff2",
+    "KaTeX_Main-BoldItalic.ttf",
+    "KaTeX_Main-BoldItalic.woff",
+    "KaTeX_Main-BoldItalic.woff2",
+    "KaTeX_Main-Italic.ttf",
+    "KaTeX_Main-Italic.woff",
+    "KaTeX_Main-Italic.woff2",
+    "KaTeX_Main-Regular.ttf",
+    "KaTeX_Main-Regular.woff",
+    "KaTeX_Main-Regular.woff2",
+    "KaTeX_Math-BoldItalic.ttf",
+    "KaTeX_Math-BoldItalic.woff",
+    "KaTeX_Math-BoldItalic.woff2",
+    "KaTeX_Math-Italic.ttf",
+    "KaTeX_Math-Italic.woff",
+    "KaTeX_Math-Italic.woff2",
+    "KaTeX_SansSerif-Bold.ttf",
+    "KaTeX_SansSerif-Bold.woff",
+    "KaTeX_SansSerif-Bold.woff2",
+    "KaTeX_SansSerif-Italic.ttf",
+    "KaTeX_SansSerif-Italic.woff",
+    "KaTeX_SansSerif-Italic.woff2",
+    "KaTeX_SansSerif-Regular.ttf",
+    "KaTeX_SansSerif-Regular.woff",
+    "KaTeX_SansSerif-Regular.woff2",
+    "KaTeX_Script-Regular.ttf",
+    "KaTeX_Script-Regular.woff",
+    "KaTeX_Script-Regular.woff2",
+    "KaTeX_Size1-Regular.ttf",
+    "KaTeX_Size1-Regular.woff",
+    "KaTeX_Size1-Regular.woff2",
+    "KaTeX_Size2-Regular.ttf",
+    "KaTeX_Size2-Regular.woff",
+    "KaTeX_Size2-Regular.woff2",
+    "KaTeX_Size3-Regular.ttf",
+    "KaTeX_Size3-Regular.woff",
+    "KaTeX_Size3-Regular.woff2",
+    "KaTeX_Size4-Regular.ttf",
+    "KaTeX_Size4-Regular.woff",
+    "KaTeX_Size4-Regular.woff2",
+    "KaTeX_Typewriter-Regular.ttf",
+    "KaTeX_Typewriter-Regular.woff",
+    "KaTeX_Typewriter-Regular.woff2",
+)
+
+# options shared by all http clients of the renderer
+_HTTP_CLIENT_OPTIONS = {"headers": {"Accept": "*/*"}, "timeout": 3}
+
+
 _CAMEL_CASE_REGEX = re.compile(r"([a-zäöü])([A-ZÄÖÜ])")
 
 
@@ -56,24 +131,47 @@ def _camel_case_replacer(match: re.Match) -> str:
     return f"{match[1]} {match[2]}".lower()
 
 
+# only called with the few distinct relation types of an atlas
+@cache
 def split_camel_case(text: str) -> str:
     return _CAMEL_CASE_REGEX.sub(_camel_case_replacer, text)
 
 
-class ExtractImageLinksParser(HTMLParser):
-    def __init__(self, *, convert_charrefs: bool = True) -> None:
-        super().__init__(convert_charrefs=convert_charrefs)
-        self.image_links = set()
+def _list_folder(path: Path) -> set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _failed_resource(url: str) -> str:
+    print(f"Failed to download resource: {url}")
+    return "/assets/empty.svg#" + url
+
+
+_LINK_REGEX = re.compile(
+    r'(?P<internal>href="(?=pattern-languages/))|(?P<external>href="(?=http))'
+)
 
-    def reset(self) -> None:
-        self.image_links = set()
-        return super().reset()
+_IMAGE_SOURCE_REGEX = re.compile(r'<img\b[^>]*\bsrc="([^"]+)"')
 
-    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag == "img":
-            for attr, value in attrs:
-                if attr == "src":
-                    self.image_links.add(value)
+# a single line of text without any markdown syntax, mistune would only escape it
+_PLAIN_TEXT_REGEX = re.compile(r"""[^\W\d_](?:[^\W_]|[ ,.;:?'"%()-])*""")
+
+
+# pattern attributes rendered with the markdown filter in the templates
+_MARKDOWN_ATTRIBUTES = (
+    "citation",
+    "intent",
+    "context",
+    "forces",
+    "solution",
+    "result",
+    "examples",
+    "related_patterns",
+    "known_uses",
+)
 
 
 class StaticRender:
@@ -83,11 +181,19 @@ class StaticRender:
         self.location = location
         self.is_planqk = is_planqk
         self._resource_map = {"": "/assets/empty.svg"}
+        self._resource_lock = Lock()
+        self._markdown_cache: dict[str, Markup] = {}
+        self._asset_files = _list_folder(location / "assets")
+        # only open while render_all runs
+        self._http: Client | None = None
+        self._asset_map_log: TextIO | None = None
         self._jinja = Environment(
             loader=PackageLoader("static_patternatlas"),
             autoescape=select_autoescape(
                 enabled_extensions=("html", "jinja2", "css"), default_for_string=True
             ),
+            auto_reload=False,
+            cache_size=-1,
         )
         self._jinja.filters["resource"] = self._resource
         self._jinja.filters["markdown"] = self._markdown
@@ -97,30 +203,66 @@ class StaticRender:
         )
         self._load_asset_map()
 
+    # jinja evaluates filters with constant arguments while compiling a template,
+    # so the templates are loaded lazily, after render_all prefetched the resources
+
+    @cached_property
+    def _empty_svg_template(self) -> Template:
+        return self._jinja.get_template("empty.svg")
+
+    @cached_property
+    def _styles_template(self) -> Template:
+        return self._jinja.get_template("styles.css")
+
+    @cached_property
+    def _languages_template(self) -> Template:
+        return self._jinja.get_template("languages.jinja2")
+
+    @cached_property
+    def _language_overview_template(self) -> Template:
+        return self._jinja.get_template("language-overview.jinja2")
+
+    @cached_property
+    def _pattern_template(self) -> Template:
+        return self._jinja.get_template("pattern.jinja2")
+
     def _load_asset_map(self):
         asset_folder = self.location / "assets"
         path = asset_folder / "asset_map.json"
-        if path.exists():
+        log_path = asset_folder / "asset_map.ndjson"
+        resources: list[tuple[str, str]] = []
+        if path.name in self._asset_files:
             try:
-                resources = loads(path.read_text())
-                for key, value in resources.items():
-                    assert (
-                        isinstance(key, str)
-                        and isinstance(value, str)
-                        and value.startswith("/assets/")
-                    )
-                    asset_path = self.location / value[1:]
-                    assert asset_path.relative_to(asset_folder)
-                    if asset_path.exists():
-                        self._resource_map[key] = value
+                resources.extend(loads(path.read_bytes()).items())
             except Exception:
                 print("Could not load asset map!")
+        if log_path.name in self._asset_files:
+            # replay the resources resolved after the asset map was last saved
+            with log_path.open(encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        key, value = loads(line)
+                    except (TypeError, ValueError):
+                        continue  # incomplete line of an interrupted run
+                    resources.append((key, value))
+        for key, value in resources:
+            if not isinstance(key, str) or not isinstance(value, str):
+                continue  # skip malformed entries without dropping the rest
+            # the listing only contains plain file names, which also rules out
+            # values pointing outside of the asset folder
+            if (
+                value.startswith("/assets/")
+                and value.removeprefix("/assets/") in self._asset_files
+            ):
+                self._resource_map[key] = value
 
     def _save_asset_map(self):
         asset_folder = self.location / "assets"
         asset_folder.mkdir(parents=True, exist_ok=True)
         path = asset_folder / "asset_map.json"
-        path.write_text(dumps(self._resource_map))
+        path.write_bytes(dumps(self._resource_map, separators=(",", ":")).encode())
+        if self._asset_map_log is not None:
+            self._asset_map_log.truncate(0)
 
     def _resource(self, url: str) -> str:
         if url is None:
@@ -130,168 +272,280 @@ class StaticRender:
         if resolved:
             return resolved
 
+        self._resolve_batch([url])
+        return self._resource_map[url]
+
+    def _resolve_batch(self, urls: list[str]):
+        if not urls:
+            return
+        with self._resource_lock:
+            # another thread may have resolved some urls while waiting for the lock
+            urls = [url for url in urls if url not in self._resource_map]
+            if not urls:
+                return
+            if len(urls) == 1 and self._http is not None:
+                resolved = [self._download_resource(urls[0])]
+            else:
+                resolved = asyncio.run(self._download_resources_async(urls))
+            self._resource_map.update(resolved)
+            if self._asset_map_log is not None:
+                self._asset_map_log.writelines(
+                    f"{dumps([url, asset_url])}\n"
+                    for url, asset_url in resolved
+                    if not asset_url.startswith("/assets/empty.svg")
+                )
+
+    def _download_resource(self, url: str) -> tuple[str, str]:
+        assert self._http is not None
         try:
-            response = get(
-                url, headers={"Accept": "*/*"}, timeout=3, follow_redirects=True
-            )
-            response.raise_for_status()
-            byte_content = response.content
-            suffixes = Path(response.url.path).suffixes
-            asset_url = f"/assets/{sha3_256(byte_content).hexdigest()}{''.join(suffixes)}"
-            path = self.location / asset_url[1:]
-            if not path.exists():
-                path.write_bytes(byte_content)
-            self._resource_map[url] = asset_url
+            response = self._http.get(url)
+            return url, self._store_resource(response)
         except Exception:
-            print(f"Failed to download resource: {url}")
-            self._resource_map[url] = "/assets/empty.svg#" + url
-
-        return self._resource_map[url]
+            return url, _failed_resource(url)
+
+    async def _download_resources_async(self, urls: list[str]) -> list[tuple[str, str]]:
+        async with AsyncClient(
+            **_HTTP_CLIENT_OPTIONS,
+            follow_redirects=True,
+            limits=Limits(max_connections=32, max_keepalive_connections=32),
+        ) as client:
+
+            async def fetch(url: str) -> tuple[str, str]:
+                try:
+                    response = await client.get(url)
+                    return url, await asyncio.to_thread(self._store_resource, response)
+                except Exception:
+                    return url, _failed_resource(url)
+
+            return await asyncio.gather(*(fetch(url) for url in urls))
+
+    def _store_resource(self, response: Response) -> str:
+        response.raise_for_status()
+        byte_content = response.content
+        suffixes = Path(response.url.path).suffixes
+        # a truncated sha256 is fast and long enough to address the assets by content
+        digest = sha256(byte_content).hexdigest()[:32]
+        asset_url = f"/assets/{digest}{''.join(suffixes)}"
+        path = self.location / asset_url[1:]
+        if path.name not in self._asset_files:
+            path.write_bytes(byte_content)
+            self._asset_files.add(path.name)
+        return asset_url
 
     def _markdown(self, markdown: str):
         if not markdown:
             return "–"
-        html = self._mistune(markdown.strip())
+        cached = self._markdown_cache.get(markdown)
+        if cached is not None:
+            return cached
+        html, image_links = self._markdown_to_html(markdown)
+        self._resolve_batch(
+            [url for url in image_links.values() if url not in self._resource_map]
+        )
+        self._markdown_cache[markdown] = self._replace_links(html, image_links)
+        return self._markdown_cache[markdown]
+
+    def _markdown_to_html(self, markdown: str) -> tuple[str, dict[str, str]]:
+        markdown = markdown.strip()
+        if _PLAIN_TEXT_REGEX.fullmatch(markdown):
+            return escape(markdown), {}
+        html = self._mistune(markdown)
         assert isinstance(html, str)
         html = html.strip()
         if html.startswith("<p>") and html.endswith("</p>"):
             html = html[3:-4]
 
-        image_link_parser = ExtractImageLinksParser()
-        image_link_parser.feed(html)
-        for link in image_link_parser.image_links:
-            replacement = self._resource(link)
-            html = html.replace(link, replacement)
+        # map the escaped image sources in the html to the actual urls
+        image_links = {link: unescape(link) for link in _IMAGE_SOURCE_REGEX.findall(html)}
+        return html, image_links
+
+    def _replace_links(self, html: str, image_links: dict[str, str]) -> Markup:
+        replacements = {
+            link: escape(self._resource(url)) for link, url in image_links.items()
+        }
+
+        def replace(match: re.Match) -> str:
+            if match["internal"]:
+                return 'href="/'
+            if match["external"]:
+                return 'target="_blank" href="'
+            if match.lastgroup == "linked":
+                # a linked image points to its local asset, not to an external page
+                return 'href="' + replacements[match["linked"]]
+            return replacements[match[0]]
+
+        regex = _LINK_REGEX
+        if replacements:
+            links = "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+            regex = re.compile(f'href="(?P<linked>{links})|{_LINK_REGEX.pattern}|{links}')
+        return Markup(regex.sub(replace, html))
+
+    def _template_resources(self) -> set[str]:
+        # constant urls passed to the resource filter, found by parsing the templates
+        urls = set()
+        for name in self._jinja.list_templates(extensions=["jinja2"]):
+            if name == "titlebar-planqk.jinja2" and not self.is_planqk:
+                continue  # only included in PlanQK builds
+            source, _, _ = self._jinja.loader.get_source(self._jinja, name)
+            for node in self._jinja.parse(source).find_all(nodes.Filter):
+                if node.name == "resource" and isinstance(node.node, nodes.Const):
+                    urls.add(node.node.value)
+        return urls
+
+    def _prefetch_resources(self, atlas: AtlasContent):
+        urls = self._template_resources()
+        urls.update(language.logo for language in atlas.languages.values())
+        urls.update(pattern.icon for pattern in atlas.patterns.values())
+
+        rendered: dict[str, tuple[str, dict[str, str]]] = {}
+        for pattern in atlas.patterns.values():
+            sections = [getattr(pattern, attr) for attr in _MARKDOWN_ATTRIBUTES]
+            sections.extend(pattern.extra_sections.values())
+            for markdown in sections:
+                if markdown and markdown not in rendered:
+                    rendered[markdown] = self._markdown_to_html(markdown)
+        for _, image_links in rendered.values():
+            urls.update(image_links.values())
+
+        self._resolve_batch(
+            [url for url in urls if url and url not in self._resource_map]
+        )
 
-        html = html.replace('href="pattern-languages/', 'href="/pattern-languages/')
-        html = html.replace('href="http', 'target="_blank" href="http')
-        return Markup(html)
+        for markdown, (html, image_links) in rendered.items():
+            self._markdown_cache[markdown] = self._replace_links(html, image_links)
+
+    def _open(self):
+        asset_folder = self.location / "assets"
+        asset_folder.mkdir(parents=True, exist_ok=True)
+        self._asset_map_log = (asset_folder / "asset_map.ndjson").open(
+            "a", encoding="utf-8", buffering=1
+        )
+        self._http = Client(
+            **_HTTP_CLIENT_OPTIONS,
+            follow_redirects=True,
+            limits=Limits(max_keepalive_connections=16),
+        )
+
+    def _close(self):
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._asset_map_log is not None:
+            self._asset_map_log.close()
+            self._asset_map_log = None
 
     def render_all(self, atlas: AtlasContent):
-        self.render_empty_picture_asset()
-        self.download_katex_fonts()
-        self.render_styles()
-        self.render_index(atlas)
-        for lang in atlas.languages.values():
-            self.render_language_overview(atlas, lang)
-            for pattern_id in lang.patterns:
-                pattern = atlas.patterns[pattern_id]
-                self.render_pattern(atlas, pattern, lang)
-        self._save_asset_map()
+        self._open()
+        try:
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                # static assets and fonts do not depend on the atlas resources
+                futures = [
+                    executor.submit(self.render_empty_picture_asset),
+                    executor.submit(self.download_katex_fonts),
+                    executor.submit(self.render_styles),
+                ]
+                self._prefetch_resources(atlas)
+                self._create_page_folders(atlas)
+                futures.append(executor.submit(self.render_index, atlas))
+                for lang in atlas.languages.values():
+                    # shared by the overview and all pattern pages of the language
+                    lang_patterns = lang.get_patterns_sorted(atlas)
+                    futures.append(
+                        executor.submit(
+                            self.render_language_overview, atlas, lang, lang_patterns
+                        )
+                    )
+                    for pattern in lang_patterns:
+                        futures.append(
+                            executor.submit(
+                                self.render_pattern, atlas, pattern, lang, lang_patterns
+                            )
+                        )
+                for future in as_completed(futures):
+                    future.result()
+            self._save_asset_map()
+        finally:
+            self._close()
+
+    def _create_page_folders(self, atlas: AtlasContent):
+        languages_folder = self.location / "pattern-languages"
+        folders = {languages_folder}
+        folders.update(languages_folder / language_id for language_id in atlas.languages)
+        folders.update(
+            languages_folder / lang.language_id / pattern_id
+            for lang in atlas.languages.values()
+            for pattern_id in lang.patterns
+        )
+        for folder in folders:
+            folder.mkdir(parents=True, exist_ok=True)
 
     def render_empty_picture_asset(self):
         folder_path = self.location / "assets"
         folder_path.mkdir(parents=True, exist_ok=True)
         path = folder_path / "empty.svg"
-        template = self._jinja.get_template("empty.svg")
-        svg = template.render()
-        path.write_text(svg)
+        svg = self._empty_svg_template.render()
+        path.write_bytes(svg.encode("utf-8"))
 
     def download_katex_fonts(self):
         folder_path = self.location / "assets" / "fonts"
         folder_path.mkdir(parents=True, exist_ok=True)
-        for font in (
-            "KaTeX_AMS-Regular.ttf",
-            "KaTeX_AMS-Regular.woff",
-            "KaTeX_AMS-Regular.woff2",
-            "KaTeX_Caligraphic-Bold.ttf",
-            "KaTeX_Caligraphic-Bold.woff",
-            "KaTeX_Caligraphic-Bold.woff2",
-            "KaTeX_Caligraphic-Regular.ttf",
-            "KaTeX_Caligraphic-Regular.woff",
-            "KaTeX_Caligraphic-Regular.woff2",
-            "KaTeX_Fraktur-Bold.ttf",
-            "KaTeX_Fraktur-Bold.woff",
-            "KaTeX_Fraktur-Bold.woff2",
-            "KaTeX_Fraktur-Regular.ttf",
-            "KaTeX_Fraktur-Regular.woff",
-            "KaTeX_Fraktur-Regular.woff2",
-            "KaTeX_Main-Bold.ttf",
-            "KaTeX_Main-Bold.woff",
-            "KaTeX_Main-Bold.woff2",
-            "KaTeX_Main-BoldItalic.ttf",
-            "KaTeX_Main-BoldItalic.woff",
-            "KaTeX_Main-BoldItalic.woff2",
-            "KaTeX_Main-Italic.ttf",
-            "KaTeX_Main-Italic.woff",
-            "KaTeX_Main-Italic.woff2",
-            "KaTeX_Main-Regular.ttf",
-            "KaTeX_Main-Regular.woff",
-            "KaTeX_Main-Regular.woff2",
-            "KaTeX_Math-BoldItalic.ttf",
-            "KaTeX_Math-BoldItalic.woff",
-            "KaTeX_Math-BoldItalic.woff2",
-            "KaTeX_Math-Italic.ttf",
-            "KaTeX_Math-Italic.woff",
-            "KaTeX_Math-Italic.woff2",
-            "KaTeX_SansSerif-Bold.ttf",
-            "KaTeX_SansSerif-Bold.woff",
-            "KaTeX_SansSerif-Bold.woff2",
-            "KaTeX_SansSerif-Italic.ttf",
-            "KaTeX_SansSerif-Italic.woff",
-            "KaTeX_SansSerif-Italic.woff2",
-            "KaTeX_SansSerif-Regular.ttf",
-            "KaTeX_SansSerif-Regular.woff",
-            "KaTeX_SansSerif-Regular.woff2",
-            "KaTeX_Script-Regular.ttf",
-            "KaTeX_Script-Regular.woff",
-            "KaTeX_Script-Regular.woff2",
-            "KaTeX_Size1-Regular.ttf",
-            "KaTeX_Size1-Regular.woff",
-            "KaTeX_Size1-Regular.woff2",
-            "KaTeX_Size2-Regular.ttf",
-            "KaTeX_Size2-Regular.woff",
-            "KaTeX_Size2-Regular.woff2",
-            "KaTeX_Size3-Regular.ttf",
-            "KaTeX_Size3-Regular.woff",
-            "KaTeX_Size3-Regular.woff2",
-            "KaTeX_Size4-Regular.ttf",
-            "KaTeX_Size4-Regular.woff",
-            "KaTeX_Size4-Regular.woff2",
-            "KaTeX_Typewriter-Regular.ttf",
-            "KaTeX_Typewriter-Regular.woff",
-            "KaTeX_Typewriter-Regular.woff2",
-        ):
-            path = folder_path / font
-            if path.exists():
-                continue
-            try:
-                response = get(
-                    f"https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/fonts/{font}",
-                    headers={"Accept": "*/*"},
-                    timeout=3,
-                )
-                response.raise_for_status()
-                path.write_bytes(response.content)
-            except Exception:
-                print(f"Failed to download font: {font}")
+        existing_fonts = _list_folder(folder_path)
+        missing_fonts = [font for font in KATEX_FONTS if font not in existing_fonts]
+        if missing_fonts:
+            asyncio.run(self._download_katex_fonts_async(folder_path, missing_fonts))
+
+    async def _download_katex_fonts_async(self, folder_path: Path, fonts: list[str]):
+        async with AsyncClient(
+            **_HTTP_CLIENT_OPTIONS,
+            limits=Limits(max_connections=16, max_keepalive_connections=16),
+        ) as client:
+
+            async def fetch(font: str):
+                try:
+                    response = await client.get(KATEX_FONTS_URL + font)
+                    response.raise_for_status()
+                    path = folder_path / font
+                    await asyncio.to_thread(path.write_bytes, response.content)
+                except Exception:
+                    print(f"Failed to download font: {font}")
+
+            await asyncio.gather(*(fetch(font) for font in fonts))
 
     def render_styles(self):
         path = self.location / "styles.css"
-        template = self._jinja.get_template("styles.css")
-        css = template.render()
-        path.write_text(css)
+        css = self._styles_template.render()
+        path.write_bytes(css.encode("utf-8"))
 
     def render_index(self, atlas: AtlasContent):
         path = self.location / "index.html"
-        template = self._jinja.get_template("languages.jinja2")
-        html = template.render(atlas=atlas, is_planqk=self.is_planqk)
-        path.write_text(html)
-        folder_path = self.location / "pattern-languages"
-        folder_path.mkdir(parents=True, exist_ok=True)
-        path = folder_path / "index.html"
-        path.write_text(html)
-
-    def render_language_overview(self, atlas: AtlasContent, language: PatternLanguage):
+        html = self._languages_template.render(atlas=atlas, is_planqk=self.is_planqk)
+        html_bytes = html.encode("utf-8")
+        path.write_bytes(html_bytes)
+        path = self.location / "pattern-languages" / "index.html"
+        path.write_bytes(html_bytes)
+
+    def render_language_overview(
+        self,
+        atlas: AtlasContent,
+        language: PatternLanguage,
+        language_patterns: list[Pattern],
+    ):
         folder_path = self.location / "pattern-languages" / language.language_id
-        folder_path.mkdir(parents=True, exist_ok=True)
         path = folder_path / "index.html"
-        template = self._jinja.get_template("language-overview.jinja2")
-        html = template.render(atlas=atlas, language=language, is_planqk=self.is_planqk)
-        path.write_text(html)
+        html = self._language_overview_template.render(
+            atlas=atlas,
+            language=language,
+            language_patterns=language_patterns,
+            is_planqk=self.is_planqk,
+        )
+        path.write_bytes(html.encode("utf-8"))
 
     def render_pattern(
-        self, atlas: AtlasContent, pattern: Pattern, language: PatternLanguage
+        self,
+        atlas: AtlasContent,
+        pattern: Pattern,
+        language: PatternLanguage,
+        language_patterns: list[Pattern],
     ):
         folder_path = (
             self.location
@@ -299,10 +553,12 @@ class StaticRender:
             / language.language_id
             / pattern.pattern_id
         )
-        folder_path.mkdir(parents=True, exist_ok=True)
         path = folder_path / "index.html"
-        template = self._jinja.get_template("pattern.jinja2")
-        html = template.render(
-            atlas=atlas, pattern=pattern, language=language, is_planqk=self.is_planqk
+        html = self._pattern_template.render(
+            atlas=atlas,
+            pattern=pattern,
+            language=language,
+            language_patterns=language_patterns,
+            is_planqk=self.is_planqk,
         )
-        path.write_text(html)
+        path.write_bytes(html.encode("utf-8"))